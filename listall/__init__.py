@@ -0,0 +1,45 @@
+# Copyright (C) 2025 Dustin Darcy <ScarcityHypothesis.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+"""
+listall: list directory structures with flexible sorting, collection and output.
+
+The implementation lives in listall._cli. This namespace is lazy (PEP 562):
+importing the package only runs this file, and _cli (argparse setup, regexes,
+etc.) is loaded the first time one of its names, like listall.main, is used.
+"""
+
+from ._version import __version__
+
+
+def __getattr__(name):
+    if name.startswith("__"):
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # import_module rather than 'from . import _cli', whose fromlist lookup
+    # would come straight back into this __getattr__.
+    from importlib import import_module
+    _cli = import_module("._cli", __name__)
+    if name == "_cli":
+        # listall._cli itself: the submodule, not an attribute inside it
+        value = _cli
+    else:
+        try:
+            value = getattr(_cli, name)
+        except AttributeError:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    # Cache it in the module dict so later lookups (e.g. repeated listall.main
+    # or listall._cli) are plain attribute hits and never come back here.
+    globals()[name] = value
+    return value
@@ -0,0 +1,27 @@
+# Copyright (C) 2025 Dustin Darcy <ScarcityHypothesis.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+# `python -m listall ...`: runs the CLI directly, no console-script launcher
+import sys
+
+from ._cli import main
+
+# argparse takes prog from argv[0], which is ".../listall/__main__.py" here.
+# 3.14+ argparse spots -m itself (and names the actual interpreter), so only
+# fill in a readable name on older versions.
+if sys.version_info < (3, 14):
+    sys.argv[0] = "python -m listall"
+
+raise SystemExit(main())
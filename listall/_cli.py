@@ -0,0 +1,943 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2025 Dustin Darcy <ScarcityHypothesis.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+import argparse
+import fnmatch
+import os
+import platform
+import re
+import sys
+import time
+from datetime import datetime
+from collections import deque
+
+try:
+    from ._version import __version__ as VERSION_STRING
+except ImportError:
+    # Run as a plain script (copied or symlinked _cli.py), with no package around
+    # it: read _version.py from beside the real file if it's there
+    try:
+        with open(os.path.join(os.path.dirname(os.path.realpath(__file__)), "_version.py")) as f:
+            VERSION_STRING = re.search(r'__version__ = "([^"]+)"', f.read()).group(1)
+    except (OSError, AttributeError):
+        VERSION_STRING = "unknown"
+
+# First run of digits in a name, for the 'sequence' sort keys.
+_NUM_RE = re.compile(r'\d+')
+# A leading './' or '.\\' (or a bare '.'), for the leader decorators.
+_LEADER_RE = re.compile(r'^\.(?:[/\\]+|$)')
+
+EXTENDED_HELP = {
+    "path-style": r"""
+Path Style Examples (--path-style, -p)
+
+Assume your project directory is:
+D:\Projects\MyApp\
+  └─ src\
+     ├─ components\
+     │  └─ Button.js
+     └─ utils\
+        └─ helpers.js
+
+If you run this from within D:\Projects\MyApp:
+   > cd D:\Projects\MyApp
+   > listall.py -d src -p rel
+
+It sees "src" as D:\Projects\MyApp\src. A file in
+D:\Projects\MyApp\src\components\Button.js
+becomes "components\Button.js" under 'rel' mode.
+
+Output:
+components/Button.js
+utils/helpers.js
+
+If you use -p rel-base instead:
+   > cd D:\Projects\MyApp
+   > listall.py -d src -p rel-base
+
+Now each path is prefixed by the basename "src":
+Output:
+src/components/Button.js
+src/utils/helpers.js
+
+-----
+If you run from a different folder, e.g. D:\Projects:
+   > cd D:\Projects
+   > listall.py -d MyApp\src -p rel
+
+The script's 'start path' is D:\Projects\MyApp\src,
+so the file paths still become:
+components/Button.js
+utils/helpers.js
+
+But with -p rel-base, you get:
+src/components/Button.js
+src/utils/helpers.js
+
+Hence, 'rel-base' always includes the basename (or a custom label) for
+the start path, whereas 'rel' does not. This can help keep listings
+clear if you're referencing multiple different directories.
+""",
+
+    # Extended help for --sort
+    "sort": r"""
+Sort Options (--sort, -s)
+
+Available choices:
+  sequence   => numeric + then text (case-sensitive)
+  isequence  => numeric + then text (case-insensitive)
+  winsequence => tries to replicate Windows Explorer style by
+                 lowercasing all letters but sorting underscores to the top
+  name       => plain text (case-sensitive)
+  iname      => plain text (case-insensitive)
+  date       => sort by file modification time
+
+Tips:
+  - 'winsequence' is handy if you want underscore-prefixed files/folders
+    at the top, but otherwise a straightforward alphabetical ordering.
+  - 'isequence' attempts to do numeric sorting (e.g., file2 < file10),
+    but in a case-insensitive way. 
+  - If you find that 'winsequence' doesn't match actual Windows Explorer
+    in some corner cases (like spaces vs. underscores), consider debugging
+    or adjusting the transform logic. 
+"""
+}
+
+def extended_help_lookup(argv):
+    """
+    Check if user typed something like:
+      listall.py --help path-style
+      listall.py -h sort
+    If so, print extended help for that param and exit.
+    Otherwise, do nothing (return).
+    """
+    # We look for -h or --help in argv.
+    # If found, see if there's a next token that might be 'path-style', 'sort', etc.
+    # If so, print from EXTENDED_HELP and exit. Else do normal help.
+    if "-h" in argv or "--help" in argv:
+        # find index
+        idx = argv.index("-h") if "-h" in argv else argv.index("--help")
+        if idx + 1 < len(argv):
+            topic = argv[idx + 1]
+            if topic in EXTENDED_HELP:
+                print(EXTENDED_HELP[topic])
+                sys.exit(0)
+    # If user typed just -h or --help alone or with an unknown topic => normal help.
+
+def numerical_sort(value):
+    """
+    Extracts the first number from 'value' (string),
+    returning (int_number, original_string). Used for 'sequence' or 'isequence' sorting.
+    """
+    m = _NUM_RE.search(value)
+    return (int(m.group()), value) if m else (0, value)
+
+def windows_explorer_sort(value):
+    """
+    A custom approach that tries to replicate Windows Explorer ordering:
+      - convert everything to lowercase
+      - keep underscores at the front (since ASCII '_' < letters)
+    For a stronger effect, we could transform '_' into a character that definitely
+    sorts to the top or bottom, but since '_' is ASCII 95, it's already before letters.
+
+    If you want underscores sorted after letters, you could do:
+      name = name.replace('_','{') 
+    but for now we'll keep underscores in the normal ASCII position (which is above letters).
+    """
+    return os.path.basename(value).lower()
+
+def get_sort_keyfn(sort_mode):
+    """
+    Returns the sort key function for file or directory paths under 'sort_mode'.
+    'i' variants are case-insensitive; 
+    'sequence' => numeric + text; 
+    'winsequence' => attempts Windows-like underscore ordering; 
+    'date' => os.path.getmtime(x).
+    """
+    _basename = os.path.basename  # local alias for the key functions below
+    sort_map = {
+        "sequence":   lambda x: numerical_sort(_basename(x)),
+        "isequence":  lambda x: numerical_sort(_basename(x).lower()),
+        "winsequence": windows_explorer_sort,
+        "name":       _basename,
+        "iname":      lambda x: _basename(x).lower(),
+        "date":       os.path.getmtime,
+    }
+    return sort_map[sort_mode]
+
+def sort_records_by_date(records):
+    """
+    Sort (path, mtime) records gathered during the scan by their mtime and
+    return just the paths. Lets 'date' sorting reuse the stat result we
+    already got from the DirEntry instead of calling os.path.getmtime again.
+    """
+    return [path for path, _ in sorted(records, key=lambda rec: rec[1])]
+
+def make_decorator(decorations):
+    """
+    Resolve the 'decorators' once and return a decorate(path) function that
+    adjusts a path string accordingly:
+      - 'no-leader': remove leading './' or '.\\'
+      - 'rel-leader': force a leading './' or '.\\' (relative paths only)
+      - 'unix': replace backslashes with '/'
+      - 'windows': replace '/' with '\\'
+    Checking the set for every path adds up on big listings, so the flags are
+    looked up here and the returned closure only does the string work.
+    """
+    strip_leader = "no-leader" in decorations or "rel-leader" in decorations
+    leader = ""
+    if "rel-leader" in decorations and "no-leader" not in decorations:
+        leader = ".\\" if "windows" in decorations else "./"
+
+    if "unix" in decorations:
+        swap_table = str.maketrans("\\", "/")
+    elif "windows" in decorations:
+        swap_table = str.maketrans("/", "\\")
+    else:
+        swap_table = None
+
+    strip = _LEADER_RE.sub
+    isabs = os.path.isabs
+
+    def decorate(path):
+        if strip_leader:
+            path = strip("", path)
+            # a leader only makes sense on relative paths ('./' + '/tmp/x' isn't one)
+            if leader and not isabs(path):
+                path = leader + path
+        if swap_table is not None:
+            path = path.translate(swap_table)
+        return path
+    return decorate
+
+def compile_exclude_patterns(patterns):
+    """
+    Combine the glob-style exclude patterns into one compiled regex, so each
+    entry name is tested with a single match() instead of an fnmatch() call
+    per pattern. Returns None when there's nothing to exclude.
+    On Windows matching is case-insensitive, as fnmatch's normcase makes it.
+    """
+    if not patterns:
+        return None
+    flags = re.IGNORECASE if os.name == "nt" else 0
+    return re.compile(
+        "|".join("(?:" + fnmatch.translate(pat) + ")" for pat in patterns),
+        flags
+    )
+
+# Stubs for partial skip
+def on_visit_directory(root, n_dirs, n_files, depth, max_depth=None, prune_large_dirs=None):
+    """
+    'descend' => normal
+    'skip' => skip subdirs
+    'partial' => store only first+last or similar
+
+    Only the counts of subdirectories/files are passed in, so the caller
+    doesn't have to build name lists just to ask the question.
+    """
+    if max_depth is not None and depth >= max_depth:
+        return "skip"
+    if prune_large_dirs is not None and n_files >= prune_large_dirs:
+        return "partial"
+    return "descend"
+
+def walk_directories(
+    start_path_abs,
+    exclude_patterns=None,
+    sort_by="iname",
+    collect="all",
+    collect_limit=None,
+    collect_limit_min=None,
+    max_depth=None,
+    prune_large_dirs=None
+):
+    """
+    Returns { abs_dir: [abs_file,...] }.
+    We'll store *all* files in the directory's own entry except
+    possibly partial or skipping if on_visit says so.
+    """
+    collected = {}
+    # For 'date' sorting grab the mtime while we hold the DirEntry, so the
+    # sort afterwards is purely in-memory. Other modes keep plain strings.
+    want_mtime = (sort_by == "date")
+
+    # Resolved once per walk rather than once per directory.
+    sort_key = None if want_mtime else get_sort_keyfn(sort_by)
+
+    def sorted_paths(entries):
+        """DirEntry list -> its paths, sorted by 'sort_by'."""
+        if not entries:
+            return []
+        if not want_mtime:
+            paths = [e.path for e in entries]
+            paths.sort(key=sort_key)  # in place, no second list
+            return paths
+        records = []
+        for e in entries:
+            try:
+                mtime = e.stat().st_mtime
+            except OSError:
+                mtime = 0
+            records.append((e.path, mtime))
+        return sort_records_by_date(records)
+
+    # With no --exclude (the default) exclude_match stays None and the
+    # per-directory filter below is skipped outright: no name lookups,
+    # no regex calls.
+    exclude_re = compile_exclude_patterns(exclude_patterns)
+    exclude_match = exclude_re.match if exclude_re is not None else None
+
+    # Walk with an explicit stack instead of recursing per subdirectory:
+    # no Python frame per directory and no RecursionError on deep trees.
+    # Children are pushed in reverse so they pop (and are stored) in sorted order.
+    stack = deque([(start_path_abs, 0)])
+    while stack:
+        root, depth = stack.pop()
+        try:
+            # scandir hands back DirEntry objects whose is_dir() answer comes
+            # from the directory listing itself (d_type / FindFirstFile), so
+            # we don't pay an extra stat per entry like os.path.isdir would.
+            with os.scandir(root) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        # Drop excluded names in one pass over the whole directory.
+        if exclude_match is not None:
+            entries = [e for e in entries if exclude_match(e.name) is None]
+
+        subdirs = []
+        files = []
+        for e in entries:
+            try:
+                is_dir = e.is_dir()
+            except OSError:
+                is_dir = False
+            if is_dir:
+                subdirs.append(e)
+            else:
+                files.append(e)
+
+        action = on_visit_directory(
+            root,
+            len(subdirs),
+            len(files),
+            depth,
+            max_depth,
+            prune_large_dirs
+        )
+        # Much like pruning dirs[:] under os.walk: decide first, then only
+        # sort (and for 'date', stat) the entries that will actually be used.
+        # Subdirs matter only if we descend; files never do for 'dirs-only'.
+        if action != "descend":
+            subdirs = []
+        if collect == "dirs-only":
+            files = []
+        subdirs = sorted_paths(subdirs)
+        files   = sorted_paths(files)
+
+        if collect != "files-only":
+            # always store directory for 'dirs-only', 'all', 'dirs-1st-last-file'
+            collected.setdefault(root, [])
+
+        if action == "partial":
+            # store only first+last (subdirs were already dropped above)
+            if len(files) > 1:
+                files = [files[0], files[-1]]
+
+        # now store files depending on collect:
+        if collect == "dirs-only":
+            pass
+        elif collect == "dirs-1st-last-file":
+            if len(files) > 1:
+                collected[root] = [files[0], files[-1]]
+            else:
+                collected[root] = files
+        elif collect == "files-only":
+            # NEW: for summary mode, we still want each directory to have its file list
+            # so we do NOT store in "" but store in the directory key
+            collected.setdefault(root, []).extend(files)
+        else:  # collect == "all"
+            collected[root] = files
+
+        # descend subdirs (already emptied if skipped/partial)
+        stack.extend((sd, depth+1) for sd in reversed(subdirs))
+
+    return collected
+
+def collect_files(
+    start_path_abs,
+    path_style,
+    collect,
+    sort_by,
+    decorate,
+    exclude_patterns=None,
+    collect_limit=None,
+    collect_limit_min=None,
+    strict_rel=False,
+    base_label=None,
+    max_depth=None,
+    prune_large_dirs=None
+):
+    raw = walk_directories(
+        start_path_abs,
+        exclude_patterns,
+        sort_by,
+        collect,
+        collect_limit,
+        collect_limit_min,
+        max_depth,
+        prune_large_dirs
+    )
+    # partial truncation if 'collect == all' and collect_limit
+    if collect == "all" and collect_limit:
+        for dkey, flist in raw.items():
+            if len(flist) > collect_limit:
+                half = max((collect_limit_min or 2)//2, 1)
+                start_slice = flist[:half]
+                end_slice   = flist[-half:]
+                raw[dkey] = start_slice + end_slice
+
+    final = adjust_paths(raw, start_path_abs, path_style, decorate, collect,
+                         strict_rel, base_label)
+    return final
+
+def adjust_paths(
+    collected_dict,
+    start_path_abs,
+    path_style,
+    decorate,
+    collect,
+    strict_rel=False,
+    base_label=None
+):
+    """
+    Convert the collected dict of {directory_path: [files]} into a version
+    that uses the requested path style. If 'strict_rel' is True, cross-drive references
+    cause an exception in rel/rel-base modes. 'base_label' is used in 'rel-base' instead
+    of os.path.basename(start_path_abs).
+	
+    Takes {dir_path: [files]} and applies path transformations 
+    (full, rel, rel-base, files-only) plus 'decorate' (from make_decorator()).
+    If 'strict_rel' is True, crossing drives in 'rel' or 'rel-base' is not allowed.
+    """
+    # 'full' only normalises paths with abspath (decorations are applied later,
+    # when formatting). Everything the walk produced is already an absolute,
+    # normalised path under an absolute start path, so that pass would hand
+    # back the same dict; skip it.
+    if path_style == "full" and start_path_abs == os.path.abspath(start_path_abs):
+        return collected_dict
+
+    # Local aliases: these run once or twice per path, so skip the
+    # os.path attribute lookups.
+    _join = os.path.join
+    _basename = os.path.basename
+    _abspath = os.path.abspath
+    _splitdrive = os.path.splitdrive
+    _relpath = os.path.relpath
+
+    # Loop invariants: the start path's drive, whether drives matter at all
+    # (POSIX paths have no drive, so everything is on the "same drive"),
+    # and the rel-base label.
+    check_drive = (os.name == "nt")
+    start_drive = _splitdrive(start_path_abs)[0].lower()
+    check_strict = strict_rel and path_style in ("rel","rel-base")
+    label = base_label if base_label else _basename(start_path_abs)
+
+    adjusted = {}
+    for dir_abs, file_list in collected_dict.items():
+        dir_abs_norm = _abspath(dir_abs)
+
+        # Cross-drive check if strict. Files sit directly inside their
+        # directory, so checking the directory covers them too.
+        same_drive = (
+            not check_drive
+            or _splitdrive(dir_abs_norm)[0].lower() == start_drive
+        )
+        if check_strict and not same_drive:
+            raise ValueError(f"Cannot create relative path across drives: {dir_abs_norm}")
+
+        # Work out the relative directory once; each file then only needs
+        # its basename appended instead of a relpath() of its own.
+        rel_dir = None
+        if path_style in ("rel","rel-base") and same_drive:
+            rel_dir = _relpath(dir_abs_norm, start_path_abs)
+            file_prefix = "" if rel_dir == "." else rel_dir
+            if path_style == "rel-base":
+                file_prefix = _join(label, file_prefix)
+                rel_dir = label if rel_dir == "." else _join(label, rel_dir)
+
+        # Convert each file path
+        adjusted_files = []
+        for f in file_list:
+            if path_style == "files-only":
+                adjusted_file = _basename(f)
+            elif rel_dir is not None:
+                adjusted_file = decorate(_join(file_prefix, _basename(f)))
+            else:
+                # full, or rel/rel-base falling back to absolute across drives
+                adjusted_file = _abspath(f)
+            adjusted_files.append(adjusted_file)
+
+        # now the directory key
+        if path_style == "files-only":
+            # 'files-only' => just store everything under the same key => '' ?
+            # But for summary we want the directory nesting. We'll store them by real dir path
+            # Then the summary logic can do braces. So let's keep the directory path but if you want old behavior 
+            # of a single list, you'd do inline mode.
+            # dir_key = ""
+            dir_key = dir_abs_norm  # keep directory path
+        elif rel_dir is not None:
+            dir_key = decorate(rel_dir)
+        else:
+            # full, or cross-drive fallback
+            dir_key = dir_abs_norm
+
+        adjusted[dir_key] = adjusted_files
+    return adjusted
+
+def build_directory_tree(collected):
+    """
+    Builds a nested dict structure from {dir_key: [file_paths], ...}
+    for hierarchical display in summary mode.
+    """
+    # Plain dicts, one per node; a new dict is only allocated the first time
+    # a path component is seen (setdefault(p, {}) would build one every time).
+    # New components are interned, so a name repeated all over the tree
+    # ("src", "tests", ...) is stored as one shared string.
+    intern = sys.intern
+    root = {}
+    for dkey in collected:
+        if dkey:
+            current = root
+            for p in dkey.split(os.sep):
+                child = current.get(p)
+                if child is None:
+                    child = current[intern(p)] = {}
+                current = child
+    return root
+
+def _name_key(name):
+    return name
+
+# Subdirectory-name sort keys for summary mode, one per 'sort_by' value.
+# They mirror the file sort keys but work on bare names, so 'date' (which
+# would need a full path for getmtime) falls back to 'name'.
+SUBDIR_SORT_KEYS = {
+    "sequence":    numerical_sort,                            # numeric + text, case-sensitive
+    "isequence":   lambda name: numerical_sort(name.lower()), # numeric + text, case-insensitive
+    "winsequence": str.lower,                                 # mimic Windows underscore + case-insensitive
+    "name":        _name_key,
+    "iname":       str.lower,
+    "date":        _name_key,
+}
+
+def get_subdir_sort_keyfn(sort_by):
+    """
+    Returns the key function used to order subdirectory names for 'sort_by'.
+    We can't do 'date' for pure subdir names (no full path), so that (and any
+    unknown mode) falls back to plain 'name'. Resolve it once and reuse it
+    rather than dispatching on 'sort_by' per name.
+    """
+    return SUBDIR_SORT_KEYS.get(sort_by, _name_key)
+
+def tree_is_presorted(sort_by, path_style, decorations):
+    """
+    True if the summary tree built from collect_files() output is already in
+    'sort_by' order at every level, so format_directory needn't sort again.
+
+    walk_directories sorts siblings with the same keys format_directory uses
+    and the tree keeps that insertion order, except when:
+      - sort_by is 'date' (subdirs fall back to 'name' when formatting),
+      - path_style is 'rel' (the root's "." key sits among its children),
+      - a leader decorator rewrites the start of the directory keys, or
+      - a slash decorator swaps in a separator other than os.sep, so the
+        keys no longer split back into the scanned names.
+    """
+    if sort_by == "date" or path_style == "rel":
+        return False
+    if decorations & {"no-leader", "rel-leader"}:
+        return False
+    native_swap = "windows" if os.sep == "\\" else "unix"
+    return decorations & {"unix", "windows"} <= {native_swap}
+
+# Yielded by format_directory in place of a line when --compact-braces wants
+# the closing brace on the previous line; iter_collected_lines folds it in.
+_CLOSE_ON_PREVIOUS = object()
+
+def iter_collected_lines(
+    collected_dict,
+    format_style,
+    collect,
+    decorate,
+    path_style,
+    sort_by,
+    indent_size=2,
+    compact_braces=False,
+    presorted=False
+):
+    """
+    Takes 'collected_dict' = { <directory_key>: [files], ... }
+    and yields the formatted lines (without newlines) for either 'inline' or
+    'summary' mode, so callers can stream them instead of holding one big string.
+    
+    The 'sort_by' param is used for subdirectory ordering in summary mode,
+    so we can replicate 'sequence', 'winsequence', etc. If 'presorted' is
+    True (see tree_is_presorted()), the subdirectories are taken in the order
+    the walk already sorted them into and aren't sorted again.
+    """
+    if format_style == "inline":
+        # Inline mode => just list directories or files
+        if collect == "dirs-only":
+            for dkey in collected_dict:
+                yield decorate(dkey)
+        else:
+            for flist in collected_dict.values():
+                for f in flist:
+                    yield decorate(f)
+        return
+
+    directory_tree = build_directory_tree(collected_dict)
+    subdir_keyfn = get_subdir_sort_keyfn(sort_by)
+    # local aliases for the per-line calls in format_directory
+    _join = os.path.join
+    _basename = os.path.basename
+
+    def format_directory(node, full_map, current_path="", level=0):
+        indent = " " * (indent_size * level)
+        findent = indent + " " * indent_size  # files sit one level deeper
+        close_line = indent + "}"
+        # Sort the subdir names themselves so the key function is called
+        # directly, once per name (for 'iname'/'winsequence' that's just
+        # str.lower, with no Python-level lambda in between).
+        names = list(node) if presorted else sorted(node, key=subdir_keyfn)
+        last = len(names) - 1
+        for i, subdir_name in enumerate(names):
+            subsubtree = node[subdir_name]
+            is_last = (i == last)
+            full_path = _join(current_path, subdir_name) if current_path else subdir_name
+
+            # If path_style=rel-base, skip decorations on subdir name:
+            dir_display = subdir_name if path_style=="rel-base" else decorate(subdir_name)
+
+            if collect == "dirs-only":
+                # In summary mode, just show subdirectories (with braces if they have children)
+                if subsubtree:
+                    yield f"{indent}{dir_display}:{{"
+                    yield from format_directory(subsubtree, full_map, full_path, level+1)
+                    if compact_braces and is_last:
+                        yield _CLOSE_ON_PREVIOUS
+                    else:
+                        yield close_line
+                else:
+                    yield f"{indent}{dir_display}"
+
+            elif collect == "files-only":
+                # Open unlabeled brace:
+                yield f"{indent}{{"
+                # if we have files in this directory
+                if full_path in full_map:
+                    for f in full_map[full_path]:
+                        yield f"{findent}{decorate(_basename(f))}"
+                # Recurse sub-subdirs
+                yield from format_directory(subsubtree, full_map, full_path, level+1)
+                if compact_braces and is_last:
+                    yield _CLOSE_ON_PREVIOUS
+                else:
+                    yield close_line
+
+            elif collect == "dirs-1st-last-file":
+                # older logic
+                has_sub = bool(subsubtree)
+                # If there's a parent or subdirs, we open braces
+                if has_sub or current_path:
+                    yield f"{indent}{dir_display}:{{"
+                else:
+                    yield f"{indent}{dir_display}"
+
+                # If this directory has files in 'collected', show first & last
+                if full_path in full_map:
+                    flist = full_map[full_path]
+                    if flist:
+                        yield f"{findent}{decorate(_basename(flist[0]))}"
+                        if len(flist)>1:
+                            yield f"{findent}{decorate(_basename(flist[-1]))}"
+
+                # Recurse subdirectories
+                if has_sub:
+                    yield from format_directory(subsubtree, full_map, full_path, level+1)
+                if has_sub or current_path:
+                    if compact_braces and is_last:
+                        yield _CLOSE_ON_PREVIOUS
+                    else:
+                        yield close_line
+
+            else:  # 'all'
+                # labeled braces - show all files in this directory + subdirectories
+                yield f"{indent}{dir_display}:{{"
+                if full_path in full_map:
+                    for ff in full_map[full_path]:
+                        yield f"{findent}{decorate(_basename(ff))}"
+                if subsubtree:
+                    yield from format_directory(subsubtree, full_map, full_path, level+1)
+                if compact_braces and is_last:
+                    yield _CLOSE_ON_PREVIOUS
+                else:
+                    yield close_line
+
+    # summary => build hierarchical braces (nested tree, walked recursively).
+    # Hold each line back by one so a compact closing brace can still be
+    # tacked onto it.
+    pending = None
+    for line in format_directory(directory_tree, collected_dict):
+        if line is _CLOSE_ON_PREVIOUS:
+            pending += "}"
+            continue
+        if pending is not None:
+            yield pending
+        pending = line
+    if pending is not None:
+        yield pending
+
+def write_lines(stream, lines):
+    """
+    Writes 'lines' to 'stream' separated by newlines (no trailing newline),
+    one at a time so the whole listing never has to be joined in memory.
+    """
+    it = iter(lines)
+    for line in it:
+        stream.write(line)
+        break
+    for line in it:
+        stream.write("\n")
+        stream.write(line)
+
+def output_results(lines, outputs, filename=None):
+    """
+    Depending on 'outputs', send 'lines' (an iterable of lines, or a single
+    string) to:
+      - a file (with optional custom 'filename')
+      - the system clipboard
+      - stdout
+      - or all
+    File and stdout output are streamed line by line; only the clipboard
+    needs the whole text joined up front.
+    """
+    tzname = time.tzname[time.localtime().tm_isdst]
+    def_name = datetime.now().strftime(f"listall_%y.%m.%d_%H-%M_{tzname}.txt")
+
+    if isinstance(lines, str):
+        lines = [lines]
+    to_file = "file" in outputs or "all" in outputs
+    to_clip = "clip" in outputs or "all" in outputs
+    to_stdout = "stdout" in outputs or "all" in outputs
+    if to_clip:
+        # Imported here: pyperclip probes for a clipboard backend on import,
+        # which plain stdout/file runs shouldn't pay for. It's also an
+        # optional dependency, so check for it before writing anything.
+        try:
+            import pyperclip
+        except ImportError:
+            print("\nError: clipboard output needs pyperclip. "
+                  "Install it with: pip install \"listall[clipboard]\"\n")
+            sys.exit(1)
+    # A generator can only be consumed once, so keep the lines around when
+    # they're going to more than one place.
+    if to_file + to_clip + to_stdout > 1 and not isinstance(lines, list):
+        lines = list(lines)
+
+    if to_file:
+        fname = filename or def_name
+        with open(fname, "w", encoding="utf-8") as f:
+            write_lines(f, lines)
+        print(f"Content written to file: {fname}")
+    if to_clip:
+        pyperclip.copy("\n".join(lines))
+        print("Content copied to clipboard.")
+    if to_stdout:
+        write_lines(sys.stdout, lines)
+        sys.stdout.write("\n")
+
+def main():
+    # Step A: Intercept `-h param` or `--help param`
+    extended_help_lookup(sys.argv[1:])
+
+    # Step B: Normal parser with epilog, rawdesc, etc.
+    parser = argparse.ArgumentParser(
+        description="List filenames, directories, or specific files with customizable sorting, collection, and output options.",
+        epilog="""
+Common usage examples:
+
+ listall.py -d . -s sequence   # implies -p rel-base -o stdout -fmt inline -c all
+ listall.py -d . -s sequence -p rel-base -f inline -o stdout   # same as above
+
+Other examples:
+ listall.py -d "path/to/dir1" "path/to/dir2" --path-style files-only --collect dirs-only --format inline --output file --filename listall_jan1st_2024.txt
+ listall.py -d . --exclude "*.txt" --exclude ".\\temp"
+ listall.py -d . -p rel -c dirs-1st-last-file -s sequence -o clip
+ listall.py -d . -c dirs-1st-last-file -s sequence --output file --filename listall_jan1st_2024.txt
+
+Use "-h [param]" for extended help on certain parameters, e.g. "-h path-style" or "--help sort".
+        """,
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--version","-v", action="version", version=f"%(prog)s {VERSION_STRING}")
+    parser.add_argument("--dir","-d", nargs="+", required=True,
+                        help="Directories to list from.")
+    parser.add_argument("--exclude","-xd", action="append",
+                        help="Exclude patterns (e.g. *.txt or dir_name). Repeatable.")
+    parser.add_argument("--path-style","-p", choices=["full","rel","rel-base","files-only"],
+                        default="rel-base",
+                        help="Path style for output (default: rel-base).")
+    parser.add_argument("--format","-fmt", choices=["inline","summary"], default="inline",
+                        help="Output formatting style (default: inline).")
+    parser.add_argument("--collect","-c", choices=["all","dirs-only","dirs-1st-last-file","files-only"],
+                        default="all",
+                        help="Collection strategy (default: all).")
+    parser.add_argument("--sort","-s", choices=["sequence","isequence","winsequence","name","iname","date"],
+                        default="iname",
+                        help="File/directory sorting strategy (default: iname). See '-h sort' for details.")
+    parser.add_argument("--output","-o", action="append",
+                        choices=["clip","stdout","file","all"],
+                        default=[],
+                        help="Output method(s). If none, defaults to stdout.")
+    parser.add_argument("--decorator","-dec", action="append",
+                        choices=["unix","windows","rel-leader","no-leader"],
+                        default=[],
+                        help="Decorate path presentation (e.g. 'unix' => forward slashes).")
+    parser.add_argument("--filename","-f",
+                        help="If '-o file', we write to this filename (or a default).")
+    parser.add_argument("--collect-limit","-cl", type=int,
+                        help="If '--collect all', truncates if directory has >N files to 1st/Nth subset.")
+    parser.add_argument("--collect-limit-min","-clm", type=int,
+                        help="Number of total files to show in truncated dirs, half at start/half at end (default:2).")
+    parser.add_argument("--strict-rel", action="store_true",
+                        help="If set, cross-drive references in rel or rel-base cause error.")
+    parser.add_argument("--base-label","-bl", type=str,
+                        help="When -p rel-base, override default subfolder name with a custom label.")
+    parser.add_argument("--indent","-i", type=int, default=2,
+                        help="Spaces per indentation level in summary mode (default:2).")
+    parser.add_argument("--compact-braces","-cb", action="store_true",
+                        help="Close braces on same line in summary mode")
+    parser.add_argument("--max-depth", type=int,
+                        help="Skip subdirectories below this depth.")
+    parser.add_argument("--prune-large-dirs", type=int,
+                        help="If a directory has >=N files, partial approach (like first+last).")
+
+    # Step 3: Parse the user's real arguments
+    args = parser.parse_args()
+
+    # Step 4: Validate at least one directory
+    if not args.dir:
+        parser.print_help()
+        print("\nError: Please provide at least one directory with --dir.\n")
+        sys.exit(1)
+
+    # Step 5: Determine decorators with system default
+    os_type = platform.system()
+    sys_def_dec = ["unix"] if os_type in ["Darwin","Linux","Unix","FreeBSD","BSD"] else ["windows"]
+    final_decs = set(args.decorator) if args.decorator else set(sys_def_dec)
+    
+    # If user provided both 'windows' and 'unix', discard system default
+    # (like older code logic)
+    if {"unix","windows"}.issubset(final_decs):
+        final_decs.discard(next(iter(sys_def_dec)))
+    decorate = make_decorator(final_decs)
+
+    # Step 6: Determine output methods
+    out_methods = set(args.output) if args.output else {"stdout"}
+    if "all" in out_methods:
+        out_methods = {"clip","stdout","file"}
+
+    # Step 7: Multidir handling: Collect from each directory separately to avoid collisions
+    def run_one(absd):
+        return collect_files(
+            start_path_abs=absd,
+            path_style=args.path_style,
+            collect=args.collect,
+            sort_by=args.sort,
+            decorate=decorate,
+            exclude_patterns=args.exclude,
+            collect_limit=args.collect_limit,
+            collect_limit_min=args.collect_limit_min,
+            strict_rel=args.strict_rel,
+            base_label=args.base_label,
+            max_depth=args.max_depth,
+            prune_large_dirs=args.prune_large_dirs
+        )
+
+    abs_dirs = list(dict.fromkeys(os.path.abspath(d) for d in args.dir))
+    if len(abs_dirs) == 1:
+        results_by_dir = {abs_dirs[0]: run_one(abs_dirs[0])}
+    else:
+        # Each root gets its own 'collected' dict, so the walks are independent.
+        # They're mostly scandir/stat calls (which release the GIL), so walking
+        # the roots on a few threads overlaps the I/O. Formatting stays serial.
+        # Imported here: concurrent.futures pulls in logging, which single-root
+        # runs (the common case) shouldn't pay for at startup.
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=min(8, len(abs_dirs))) as ex:
+            results_by_dir = dict(zip(abs_dirs, ex.map(run_one, abs_dirs)))
+
+    presorted = tree_is_presorted(args.sort, args.path_style, final_decs)
+
+    # If only one directory, we can flatten results
+    if len(results_by_dir)==1:
+        # Single directory => straightforward
+        col = next(iter(results_by_dir.values()))
+        lines = iter_collected_lines(
+            col,
+            format_style=args.format,
+            collect=args.collect,
+            decorate=decorate,
+            path_style=args.path_style,
+            sort_by=args.sort,
+            indent_size=args.indent,
+            compact_braces=args.compact_braces,
+            presorted=presorted
+        )
+    else:
+        # Multiple directories => label each section
+        def iter_lumps():
+            for rootd, subdict in results_by_dir.items():
+                yield f"=== Listing for: {rootd} ==="
+                block_empty = True
+                for line in iter_collected_lines(
+                    subdict,
+                    format_style=args.format,
+                    collect=args.collect,
+                    decorate=decorate,
+                    path_style=args.path_style,
+                    sort_by=args.sort,
+                    indent_size=args.indent,
+                    compact_braces=args.compact_braces,
+                    presorted=presorted
+                ):
+                    block_empty = False
+                    yield line
+                if block_empty:
+                    # an empty block still took up its own (blank) line
+                    yield ""
+                yield ""
+        lines = iter_lumps()
+
+    # Step 8: Output
+    output_results(lines, out_methods, args.filename)
+
+if __name__=="__main__":
+    main()
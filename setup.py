@@ -1,32 +1,106 @@
-from setuptools import setup
+import importlib.util
+import os
 
+from setuptools import Extension, setup
+from setuptools.command.build_ext import build_ext
+
+# Make setuptools write `listall` console scripts that import listall directly
+# instead of going through pkg_resources' load_entry_point() (which costs a
+# big chunk of startup on every run). Only affects the legacy easy_install
+# script writer (setup.py install/develop, older `pip install -e .`); wheel
+# installs already get a direct-import launcher. Same idea as the
+# fastentrypoints package, done inline so there's no extra file to ship.
+# Setuptools versions without a real easy_install just skip it.
+FAST_SCRIPT_TEMPLATE = """\
+# -*- coding: utf-8 -*-
+import re
+import sys
+
+from {module} import {attr}
+
+if __name__ == '__main__':
+    sys.argv[0] = re.sub(r'(-script\\.pyw?|\\.exe)?$', '', sys.argv[0])
+    sys.exit({func}())
+"""
+
+try:
+    from setuptools.command import easy_install
+except ImportError:
+    easy_install = None
+
+# Check the module dict rather than hasattr(): once setuptools dropped
+# easy_install, the module became a shim whose __getattr__ warns (and will
+# later fail) on ScriptWriter, and nothing writes legacy scripts any more.
+if easy_install is not None and "ScriptWriter" in vars(easy_install):
+    @classmethod
+    def _fast_get_args(cls, dist, header=None):
+        if header is None:
+            header = cls.get_header()
+        for type_ in "console", "gui":
+            for name, ep in dist.get_entry_map(type_ + "_scripts").items():
+                cls._ensure_safe_name(name)
+                script_text = FAST_SCRIPT_TEMPLATE.format(
+                    module=ep.module_name, attr=ep.attrs[0], func=".".join(ep.attrs))
+                yield from cls._get_script_args(type_, name, header, script_text)
+
+    easy_install.ScriptWriter.get_args = _fast_get_args
+
+# Optional speedup (opt-in): with LISTALL_CYTHON=1 and Cython installed at build
+# time, listall/_cli.py is also compiled (as-is, in Cython's pure-Python mode)
+# into a C extension module. Python imports the extension in preference to
+# _cli.py, so the walk and formatting loops run compiled. Otherwise, or if
+# compiling fails, only the plain _cli.py is installed, exactly as before.
+# e.g.:  pip install cython && LISTALL_CYTHON=1 pip install --no-build-isolation .
+#
+# Only Cython's presence is checked here; cythonize() itself waits until
+# build_ext actually compiles the module, so metadata-only passes (pip
+# preparing metadata, egg_info, sdist) don't pay for translating _cli.py to C.
+if os.environ.get("LISTALL_CYTHON") == "1" and importlib.util.find_spec("Cython") is not None:
+    ext_modules = [Extension("listall._cli", ["listall/_cli.py"])]
+else:
+    ext_modules = []
+
+class optional_build_ext(build_ext):
+    """build_ext that drops the extension instead of failing, so the pure-Python module is the fallback."""
+    def run(self):
+        # Editable/in-place builds would put the .so next to _cli.py, where it
+        # shadows the source and edits to _cli.py silently stop taking effect.
+        if self.inplace or getattr(self, "editable_mode", False):
+            if self.extensions:
+                print("WARNING: not compiling listall._cli for an in-place/editable build")
+            self._drop_extensions(list(self.extensions))
+        self._failed = []
+        super().run()
+        self._drop_extensions(self._failed)
+
+    def build_extension(self, ext):
+        try:
+            from Cython.Build import cythonize
+            # Swap the .py source for the generated .c only now, at compile time
+            ext.sources = cythonize(
+                [ext], compiler_directives={"language_level": "3"}, quiet=True
+            )[0].sources
+            super().build_extension(ext)
+        except Exception as e:
+            print(f"WARNING: skipping optional compiled {ext.name} ({e})")
+            self._failed.append(ext)
+
+    def _drop_extensions(self, dropped):
+        if not dropped:
+            return
+        # self.extensions is normally the distribution's own list; filter in place
+        for exts in (self.extensions, self.distribution.ext_modules):
+            if exts:
+                exts[:] = [ext for ext in exts if ext not in dropped]
+        # bdist_wheel picked pure vs. platform-specific before the build ran;
+        # with nothing compiled left, tag the wheel py3-none-any again
+        bdist_wheel = self.distribution.command_obj.get("bdist_wheel")
+        if bdist_wheel is not None and not self.distribution.has_ext_modules():
+            bdist_wheel.root_is_pure = True
+
+# All package metadata lives in pyproject.toml ([project] table). setup.py
+# only remains for the build-time hooks above.
 setup(
-    name="listall",
-    version="0.0.2.1",
-    description="A flexible directory listing tool for sorting, truncating, collecting files, etc.",
-    long_description=open("README.md", encoding="utf-8").read(),  # optional
-    long_description_content_type="text/markdown",                # optional if using README.md
-    author="Dustin Darcy",
-    author_email="dustin@scarcityhypothesis.org",
-    url="https://github.com/djdarcy/listall",   # or your repo link
-    py_modules=["listall"],  # our script is 'listall.py'
-    # If you have other dependencies, list them here:
-    install_requires=[
-        "pyperclip",
-        # e.g., "some_other_package>=1.0"
-    ],
-    entry_points={
-        "console_scripts": [
-            # "listall" => the command users will type
-            # "listall:main" => the 'main' function inside 'listall' module
-            "listall=listall:main",
-        ]
-    },
-    # optional classifiers
-    classifiers=[
-        "Programming Language :: Python :: 3",
-        "License :: OSI Approved :: GPL 3",
-        "Operating System :: OS Independent",
-    ],
-    python_requires=">=3.6",   # or whatever minimum version
+    ext_modules=ext_modules,  # optional compiled copy of listall/_cli.py (see above)
+    cmdclass={"build_ext": optional_build_ext},
 )